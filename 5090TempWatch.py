@@ -15,29 +15,73 @@ Features:
 """
 
 import tkinter as tk
-from tkinter import ttk
 import serial
 import serial.tools.list_ports
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
+import numpy as np
 import time
 import datetime
 import os
+import re
+import bisect
 import threading
+import queue
+import atexit
+import shutil
 import subprocess
 import sys
-from pystray import Icon, Menu, MenuItem
+import ctypes
+from pystray import Icon, MenuItem
 from PIL import Image, ImageDraw, ImageFont
-import io
-from io import BytesIO
 import pyttsx3
-from tkinter import messagebox
 from matplotlib.figure import Figure
 
 # Global configuration
 numberOfThermistors = 8
 SERIAL_BAUDRATE = 115200
+SERIAL_TIMEOUT = 0.2  # Seconds a blocking read waits before the loop re-checks self.running
+SERIAL_RX_BUFFER = 65536  # Driver receive buffer (Windows) so read stalls cannot overrun the UART
+DEBUG_SERIAL = False  # Print every received line and completed cycle (slow; for debugging only)
+LOG_BATCH_INTERVAL = 0.5  # Seconds the log writer collects messages before writing them
+LOG_BATCH_SIZE = 64  # Write early once this many messages are waiting
+ICON_UPDATE_INTERVAL = 1.0  # Minimum seconds between tray icon changes
+WATCHDOG_TIMEOUT = 2.5  # Seconds without a valid reading before the sensor board is considered lost
+SHUTDOWN_SPEECH_TIMEOUT = 10  # Longest the shutdown waits for its final announcement
+TEMP_THRESHOLDS = (80, 90, 100)  # °C bounds of warning level 1, warning level 2 and shutdown
+TEMP_WARNINGS = {
+    1: ("Caution. GPU power connector temperature rising. Possible connector failure.", 'warning1'),
+    2: ("GPU power connector temperature warning. Temperature above 90 degrees.", 'warning2'),
+}
+TEMP_LINE_PATTERN = re.compile(rb'Temp\s+(\d+)\s*:\s*(-?\d+(?:\.\d+)?)\s*C')  # b'Temp N: VC'
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer backed by a preallocated NumPy array.
+    New entries overwrite the oldest once the buffer is full.
+    Appends (serial thread) and views (Tk thread) are serialised by a lock.
+    """
+
+    def __init__(self, capacity, dtype):
+        self.buf = np.zeros(capacity, dtype=dtype)  # Only slots already written are ever viewed
+        self.capacity = capacity
+        self.head = 0  # Slot the next entry is written to
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def append(self, value):
+        """Write an entry into the next slot, overwriting the oldest when full"""
+        with self.lock:
+            self.buf[self.head] = value
+            self.head = (self.head + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def view(self):
+        """Return a copy of the entries oldest first, safe from later appends"""
+        with self.lock:
+            head = self.head
+            if self.count < self.capacity:
+                return self.buf[:head].copy()
+            return np.concatenate((self.buf[head:], self.buf[:head]))
 
 class TemperatureMonitor:
     """
@@ -47,9 +91,6 @@ class TemperatureMonitor:
 
     def __init__(self):
         """Initialize the temperature monitoring system and its components."""
-        # Initialize data storage
-        self.temp_data = [[] for _ in range(numberOfThermistors)]
-        self.timestamps = []
         self.running = True
         
         # Set up logging
@@ -59,9 +100,23 @@ class TemperatureMonitor:
         self.log_file = os.path.join(self.log_dir, "temp_log.txt")
         self.last_port_file = os.path.join(self.log_dir, "last_port.txt")
         
+        # Keep a single buffered log handle open for the lifetime of the app;
+        # messages are queued and written in batches by a background thread
+        self.log_handle = open(self.log_file, "a", buffering=65536)
+        self.log_queue = queue.Queue()
+        self.log_thread = threading.Thread(target=self.log_worker, daemon=True)
+        self.log_thread.start()
+        atexit.register(self.close_log)
+        
         # Log startup
-        with open(self.log_file, "a") as log:
-            log.write(f"\n{datetime.datetime.now()} - Application started\n")
+        self.write_log(f"\n{datetime.datetime.now()} - Application started\n")
+        
+        # Resolve the shutdown command up front so the emergency path can spawn it directly
+        if os.name == 'nt':  # Windows
+            shutdown_exe = os.path.join(os.environ.get('SystemRoot', 'C:\\Windows'), 'System32', 'shutdown.exe')
+            self.shutdown_cmd = [shutdown_exe, '/s', '/t', '1', '/c', 'Critical GPU temperature detected']
+        else:  # Linux/Unix
+            self.shutdown_cmd = [shutil.which('shutdown') or 'shutdown', '-h', 'now']
         
         # Initialize serial connection
         self.serial_port = None
@@ -69,11 +124,29 @@ class TemperatureMonitor:
         
         # Initialize data storage for graphing
         self.window_minutes = 10  # Set window size to 10 minutes
+        self.window_span = datetime.timedelta(minutes=self.window_minutes)
         # Calculate number of points needed for 10 minutes
         # Assuming we get 8 readings (one per sensor) every ~0.5 seconds
         self.data_points = self.window_minutes * 120  # 120 points per minute
-        self.temp_history = [deque(maxlen=self.data_points) for _ in range(numberOfThermistors)]
-        self.time_history = deque(maxlen=self.data_points)
+        # Headroom on the right of the graph so the x-axis only moves every 30 seconds
+        self.graph_step = datetime.timedelta(seconds=30)
+        # Graph refresh intervals in ms, independent of the serial data rate
+        self.graph_update_ms = 2000  # While the graph window is shown
+        self.graph_hidden_update_ms = 5000  # Back off while it is hidden
+        self.graph_interval_ms = self.graph_update_ms  # Current interval, stretched while drawing is slow
+        self.graph_dirty = False  # Set by the serial thread when a reading cycle completes
+        self.redraw_pending = False
+        self.draw_time = 0.0  # Smoothed seconds spent per redraw
+        # Ring buffer holding one record per completed reading cycle (NaN = no reading).
+        # Time and temperatures share a record so a single append keeps them aligned.
+        self.history = RingBuffer(self.data_points, np.dtype([
+            ('time', 'datetime64[ms]'),
+            ('temps', np.float32, (numberOfThermistors,)),
+        ]))
+        self.cycle_temps = np.full(numberOfThermistors, np.nan, dtype=np.float32)  # Cycle being filled
+        self.temps = [-999] * numberOfThermistors  # Latest reading per sensor
+        self.temp_levels = [0] * numberOfThermistors  # Latest threshold level per sensor
+        self.temps_changed = False  # Whether any sensor changed value in the current batch
         self.readings_count = 0
         
         # Initialize graph window
@@ -84,29 +157,57 @@ class TemperatureMonitor:
         self.root = tk.Tk()
         self.root.withdraw()  # Hide the root window
         
-        # Set up system tray icon
+        # Load the icon font and background tiles once and pre-render icons for 0-130°C
+        try:
+            self.icon_font = ImageFont.truetype("arial.ttf", 16)
+        except OSError:  # Font not installed (e.g. outside Windows)
+            self.icon_font = ImageFont.load_default()
+        self.icon_tiles = {color: Image.new('RGBA', (32, 32), color + (255,))
+                           for color in [(0, 255, 0), (255, 255, 0), (255, 0, 0)]}
+        self.icon_cache = {t: self.create_temp_icon(t) for t in range(0, 131)}
+        self.icon_temp = None  # Integer max temperature the icon should show
+        self.last_icon_temp = None  # Integer max temperature the icon currently shows
+        self.last_icon_update = float('-inf')  # time.monotonic() of the last icon change
+        
+        # Set up system tray icon; icons are rendered and swapped on a helper thread
         self.setup_tray_icon()
+        self.icon_queue = queue.Queue()
+        threading.Thread(target=self.icon_worker, daemon=True).start()
         
         # Create graph window
         self.create_graph_window()
         
-        # Start serial reading in a separate thread
+        # Initialize text-to-speech; a single worker thread owns the engine
+        self.tts_queue = queue.Queue(maxsize=4)  # Small: a backlog of stale warnings is useless
+        self.last_warning_time = {
+            # time.monotonic() of the last spoken warning; -inf so the first one is never held back
+            'warning1': float('-inf'),  # for 80°C warnings
+            'warning2': float('-inf')   # for 90°C warnings
+        }
+        self.tts_thread = threading.Thread(target=self.tts_worker, daemon=True)
+        self.tts_thread.start()
+        
+        # Start serial reading in a separate thread; it signals the watchdog on every reading
+        self.data_event = threading.Event()
         self.serial_thread = threading.Thread(target=self.read_serial, daemon=True)
         self.serial_thread.start()
+        self.watchdog_thread = threading.Thread(target=self.watchdog_monitor, daemon=True)
+        self.watchdog_thread.start()
         
         # Schedule graph updates
         self.schedule_graph_update()
         
-        # Initialize text-to-speech engine
-        self.tts_engine = pyttsx3.init()
-        self.last_warning_time = {
-            'warning1': 0,  # for 80°C warnings
-            'warning2': 0   # for 90°C warnings
-        }
-        
         # Start Tkinter main loop
         self.root.mainloop()
 
+    def open_serial(self, device):
+        """Open a serial port configured for blocking reads with a timeout"""
+        port = serial.Serial(device, SERIAL_BAUDRATE, timeout=SERIAL_TIMEOUT,
+                             inter_byte_timeout=0.05)
+        if os.name == 'nt':
+            port.set_buffer_size(rx_size=SERIAL_RX_BUFFER)
+        return port
+
     def init_serial(self):
         """Try to connect to the last known port first, then scan for available ports"""
         # Try last known port first
@@ -114,13 +215,12 @@ class TemperatureMonitor:
             with open(self.last_port_file, 'r') as f:
                 last_port = f.read().strip()
                 try:
-                    self.serial_port = serial.Serial(last_port, SERIAL_BAUDRATE)
+                    self.serial_port = self.open_serial(last_port)
                     # Flush input buffer
                     self.serial_port.reset_input_buffer()
                     time.sleep(0.1)  # Give it a moment to clear
                     print(f"Connected to last known port {last_port}")
-                    with open(self.log_file, "a") as log:
-                        log.write(f"{datetime.datetime.now()} - Connected to last known port {last_port}\n")
+                    self.write_log(f"{datetime.datetime.now()} - Connected to last known port {last_port}\n")
                     return
                 except serial.SerialException:
                     pass
@@ -131,45 +231,85 @@ class TemperatureMonitor:
         ports = list(serial.tools.list_ports.comports())
         for port in ports:
             try:
-                self.serial_port = serial.Serial(port.device, SERIAL_BAUDRATE)
+                self.serial_port = self.open_serial(port.device)
                 # Flush input buffer
                 self.serial_port.reset_input_buffer()
                 time.sleep(0.1)  # Give it a moment to clear
                 with open(self.last_port_file, 'w') as f:
                     f.write(port.device)
                 print(f"Connected to {port.device}")
-                with open(self.log_file, "a") as log:
-                    log.write(f"{datetime.datetime.now()} - Connected to {port.device}\n")
+                self.write_log(f"{datetime.datetime.now()} - Connected to {port.device}\n")
                 return
             except serial.SerialException:
                 continue
         
         print("No serial port found")
-        with open(self.log_file, "a") as log:
-            log.write(f"{datetime.datetime.now()} - ERROR: No serial port found\n")
+        self.write_log(f"{datetime.datetime.now()} - ERROR: No serial port found\n")
+
+    def write_log(self, message):
+        """Queue a message for the background log writer"""
+        self.log_queue.put(message)
+
+    def flush_log(self):
+        """Block until every queued log message has been written to disk"""
+        if self.log_thread.is_alive():
+            # The writer sets the Event right after writing its batch instead of
+            # waiting out the rest of the batch interval
+            flushed = threading.Event()
+            self.log_queue.put(flushed)
+            flushed.wait(timeout=2)
+
+    def close_log(self):
+        """Stop the log writer once everything queued has been written"""
+        if self.log_thread.is_alive():
+            self.log_queue.put(None)
+            self.log_thread.join(timeout=2)
+
+    def log_worker(self):
+        """Collect queued log messages and write them to disk in batches"""
+        while True:
+            batch = [self.log_queue.get()]
+            
+            # Gather whatever else arrives within the batch interval; a flush request
+            # (an Event from flush_log) or the stop signal writes the batch right away
+            deadline = time.monotonic() + LOG_BATCH_INTERVAL
+            while isinstance(batch[-1], str) and len(batch) < LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self.log_handle.write("".join(m for m in batch if isinstance(m, str)))
+                self.log_handle.flush()
+            except Exception as e:
+                print(f"Error writing to log file: {str(e)}")
+            finally:
+                if isinstance(batch[-1], threading.Event):
+                    batch[-1].set()
+            
+            # None is the stop signal sent by close_log
+            if batch[-1] is None:
+                self.log_handle.close()
+                return
 
     def create_temp_icon(self, temperature):
         """Creates an icon showing the temperature on a colored background"""
-        img = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Set background color based on temperature
+        # Start from the pre-rendered background tile for the temperature's color
         if temperature < 60:
             color = (0, 255, 0)  # Green
         elif temperature < 80:
             color = (255, 255, 0)  # Yellow
         else:
             color = (255, 0, 0)  # Red
-            
-        # Draw filled rectangle with rounded corners
-        draw.rectangle([0, 0, 31, 31], fill=color)
+        img = self.icon_tiles[color].copy()
+        draw = ImageDraw.Draw(img)
         
         # Add temperature text
-        try:
-            font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            font = ImageFont.load_default()
-            
+        font = self.icon_font
         text = str(int(temperature))
         text_width = draw.textlength(text, font=font)
         text_height = 16
@@ -179,10 +319,26 @@ class TemperatureMonitor:
         
         return img
 
+    def icon_worker(self):
+        """Render and show queued tray icon temperatures, skipping stale ones"""
+        while self.running:
+            icon_temp = self.icon_queue.get()
+            # Only the newest temperature matters if several are waiting
+            while not self.icon_queue.empty():
+                icon_temp = self.icon_queue.get_nowait()
+            try:
+                icon = self.icon_cache.get(icon_temp)
+                if icon is None:  # Outside the pre-rendered range
+                    icon = self.create_temp_icon(icon_temp)
+                self.tray_icon.icon = icon
+            except Exception as e:
+                print(f"Error updating tray icon: {str(e)}")
+
     def setup_tray_icon(self):
         """Configure and launch the system tray icon"""
         menu_items = (MenuItem('Show/Hide Graph', self.toggle_graph), MenuItem('Exit', self.quit_app))
-        self.tray_icon = Icon('temp', Image.new('RGB', (32, 32), 'red'), 
+        # Until the first reading arrives, show the plain red background tile
+        self.tray_icon = Icon('temp', self.icon_tiles[(255, 0, 0)], 
                              "GPU Temp Monitor", menu_items)
         # Run the tray icon in a separate thread
         threading.Thread(target=self.tray_icon.run, daemon=True).start()
@@ -197,15 +353,63 @@ class TemperatureMonitor:
         # Create matplotlib figure
         self.fig = Figure(figsize=(10, 6))
         self.ax = self.fig.add_subplot(111)
+        
+        # One line per sensor, animated so it can be blitted over a cached background
+        self.lines = [self.ax.plot([], [], label=f'Sensor {i}', animated=True)[0]
+                      for i in range(numberOfThermistors)]
+        
+        # Configure graph once; only the lines change between updates
+        self.ax.set_xlabel('Time')
+        self.ax.set_ylabel('Temperature (°C)')
+        self.ax.set_title('Temperature History (10 Minute Window)')
+        self.ax.set_ylim(0, 130)  # Set y-axis from 0°C to 130°C
+        self.ax.set_autoscale_on(False)  # Limits are managed explicitly; never rescan the data
+        self.ax.grid(True)
+        self.ax.legend()
+        self.xlim_end = None
+        self.background = None
+        
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_window)
+        # Every full draw (first show, resize, x-axis step) re-captures the background
+        self.canvas.mpl_connect('draw_event', self.on_graph_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
 
+    def on_graph_draw(self, event):
+        """Cache the static background after a full draw and paint the lines on top"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
     def schedule_graph_update(self):
         """Schedule the next graph update"""
         if self.running:
-            self.update_graph()
-            self.root.after(1000, self.schedule_graph_update)  # Update every second
+            # Skip all plotting work while the graph window is hidden in the tray
+            if self.graph_visible:
+                # Redraw only for new data or a due axis step
+                axis_due = self.xlim_end is not None and datetime.datetime.now() >= self.xlim_end
+                if self.graph_dirty or axis_due:
+                    self.request_redraw()
+                self.root.after(self.graph_interval_ms, self.schedule_graph_update)
+            else:
+                self.root.after(self.graph_hidden_update_ms, self.schedule_graph_update)
+
+    def request_redraw(self):
+        """Redraw once Tk is idle; requests made while one is pending collapse into it"""
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self.redraw_graph)
+
+    def redraw_graph(self):
+        """Redraw the graph and adapt the refresh interval to how long drawing takes"""
+        self.redraw_pending = False
+        self.graph_dirty = False
+        start = time.monotonic()
+        self.update_graph()
+        # Back off to twice the interval while redraws are slow, recover once they are fast again
+        # (full redraws render synchronously in update_graph, so they are included here)
+        self.draw_time = 0.8 * self.draw_time + 0.2 * (time.monotonic() - start)
+        self.graph_interval_ms = self.graph_update_ms * (2 if self.draw_time > 0.5 else 1)
 
     def update_graph(self):
         """Update the graph with new temperature data"""
@@ -215,47 +419,45 @@ class TemperatureMonitor:
         try:
             # Only update if we have more than 3 readings
             if self.readings_count > 3:
-                # Clear the figure
-                self.ax.clear()
-
-                # Get the current time points
-                times = list(self.time_history)
+                # Completed cycles in oldest-to-newest order
+                history = self.history.view()
+                times = history['time']
+                temps = history['temps']
                 current_time = datetime.datetime.now()
+                full_redraw = self.background is None
                 
-                # Set x-axis limits for 10-minute window
-                if len(times) > 0:
-                    oldest_allowed_time = current_time - datetime.timedelta(minutes=self.window_minutes)
-                    
-                    # Find valid data within the time window
-                    for i in range(numberOfThermistors):
-                        # Get valid temperatures and their corresponding times
-                        valid_data = [(t, temp) for t, temp in zip(times, self.temp_history[i]) 
-                                     if temp > -999 and t >= oldest_allowed_time]
-                        
-                        if valid_data:
-                            # Unzip the valid data pairs
-                            plot_times, plot_temps = zip(*valid_data)
-                            self.ax.plot(plot_times, plot_temps, label=f'Sensor {i}')
-                    
-                    # Set fixed axis limits
-                    self.ax.set_xlim(oldest_allowed_time, current_time)
-                    self.ax.set_ylim(0, 130)  # Set y-axis from 0°C to 130°C
-
-                # Configure graph
-                self.ax.set_xlabel('Time')
-                self.ax.set_ylabel('Temperature (°C)')
-                self.ax.set_title('Temperature History (10 Minute Window)')
-                self.ax.grid(True)
+                # Move the 10-minute x-axis window forward in steps rather than every update
+                if self.xlim_end is None or current_time >= self.xlim_end:
+                    self.xlim_end = current_time + self.graph_step
+                    self.ax.set_xlim(self.xlim_end - self.window_span, self.xlim_end)
+                    full_redraw = True
                 
-                # Only add legend if we have data
-                if any(any(t > -999 for t in sensor) for sensor in self.temp_history):
-                    self.ax.legend()
-
-                # Format x-axis
-                self.fig.autofmt_xdate()
-
-                # Update the canvas
-                self.canvas.draw()
+                # Same unit as the history, so the crop is one native datetime64 comparison
+                oldest_allowed_time = np.datetime64(current_time - self.window_span, 'ms')
+                
+                # Crop to the time window once; the x data is shared by every sensor
+                in_window = times >= oldest_allowed_time
+                times = times[in_window]
+                temps = temps[in_window]
+                
+                # Missing readings are NaN, which matplotlib leaves as gaps; sensors with
+                # no reading in the window are hidden (one reduction over all sensors)
+                has_data = np.isfinite(temps).any(axis=0)
+                for i, line in enumerate(self.lines):
+                    line.set_data(times, temps[:, i])
+                    line.set_visible(has_data[i])
+                
+                if full_redraw:
+                    # Axis changed: redraw everything now (the draw event re-captures the
+                    # background); this already runs from an idle callback
+                    self.fig.autofmt_xdate()
+                    self.canvas.draw()
+                else:
+                    # Only the lines changed: restore the cached background and blit them
+                    self.canvas.restore_region(self.background)
+                    for line in self.lines:
+                        self.ax.draw_artist(line)
+                    self.canvas.blit(self.ax.bbox)
 
         except Exception as e:
             print(f"Error updating graph: {str(e)}")
@@ -268,54 +470,87 @@ class TemperatureMonitor:
         else:
             self.graph_window.deiconify()  # Show the graph window
             self.graph_visible = True
+            # Catch up on data that arrived while hidden instead of waiting for the next tick
+            self.request_redraw()
+
+    def tts_worker(self):
+        """Speak queued messages one at a time on a single pyttsx3 engine"""
+        self.tts_engine = pyttsx3.init()
+        while self.running:
+            # Entries are (message, Event set once it has been spoken, or None)
+            message, spoken = self.tts_queue.get()
+            try:
+                self.tts_engine.say(message)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                print(f"Text-to-speech error: {str(e)}")
+            finally:
+                if spoken:
+                    spoken.set()
+
+    def queue_speech(self, message):
+        """Hand a message to the speech thread without blocking; False if it is backed up"""
+        try:
+            self.tts_queue.put_nowait((message, None))
+            return True
+        except queue.Full:
+            return False
 
     def speak_warning(self, message, warning_type):
         """Speak a warning message with rate limiting"""
-        current_time = time.time()
+        current_time = time.monotonic()  # Immune to wall-clock steps (NTP, manual changes)
         
         if warning_type == 'warning1':  # 80°C warning
             if current_time - self.last_warning_time['warning1'] >= 60:  # Every minute
-                self.tts_engine.say(message)
-                self.tts_engine.runAndWait()
-                self.last_warning_time['warning1'] = current_time
+                if self.queue_speech(message):
+                    self.last_warning_time['warning1'] = current_time
                 
         elif warning_type == 'warning2':  # 90°C warning
             if current_time - self.last_warning_time['warning2'] >= 10:  # Every 10 seconds
-                self.tts_engine.say(message)
-                self.tts_engine.runAndWait()
-                self.last_warning_time['warning2'] = current_time
+                if self.queue_speech(message):
+                    self.last_warning_time['warning2'] = current_time
 
     def shutdown_system(self):
-        """Gracefully shutdown the system"""
+        """Gracefully shutdown the system; returns whether the shutdown command was started"""
         try:
-            # Log the shutdown
-            with open(self.log_file, "a", buffering=1) as log:
-                log.write(f"{datetime.datetime.now()} - CRITICAL: Temperature exceeded 100C - Initiating system shutdown\n")
-                log.flush()
+            # Log the shutdown and make sure it reaches the disk
+            self.write_log(f"{datetime.datetime.now()} - CRITICAL: Temperature exceeded 100C - Initiating system shutdown\n")
+            self.flush_log()
             
-            # Speak final warning
-            self.tts_engine.say("Critical temperature reached. System shutting down now.")
-            self.tts_engine.runAndWait()
+            # Speak final warning and wait (bounded) until it has been said; if the
+            # speech thread has died nothing would ever speak it, so skip it
+            if self.tts_thread.is_alive():
+                # Drop stale warnings so the final message is the next one spoken
+                while True:
+                    try:
+                        self.tts_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                spoken = threading.Event()
+                try:
+                    self.tts_queue.put_nowait(("Critical temperature reached. System shutting down now.", spoken))
+                    spoken.wait(SHUTDOWN_SPEECH_TIMEOUT)
+                except queue.Full:  # Refilled in the meantime; shutting down matters more
+                    pass
             
-            # Initiate system shutdown
-            if os.name == 'nt':  # Windows
-                os.system('shutdown /s /t 1 /c "Critical GPU temperature detected"')
-            else:  # Linux/Unix
-                os.system('shutdown -h now')
+            # Initiate system shutdown without going through a shell
+            creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            subprocess.Popen(self.shutdown_cmd, creationflags=creationflags)
             
             # Clean up application resources
             # self.quit_app()
+            return True
                 
         except Exception as e:
             print(f"Error during shutdown: {str(e)}")
-            with open(self.log_file, "a", buffering=1) as log:
-                log.write(f"{datetime.datetime.now()} - ERROR: Shutdown failed: {str(e)}\n")
-                log.flush()
+            self.write_log(f"{datetime.datetime.now()} - ERROR: Shutdown failed: {str(e)}\n")
+            self.flush_log()
+            return False
 
     def read_serial(self):
-        """Read and process serial data"""
+        """Read serial data in batches and hand complete lines to the parser"""
         print("Starting serial read loop")
-        temps = [-999] * numberOfThermistors
+        buffer = bytearray()
         
         # Clear any initial garbage data
         if self.serial_port and self.serial_port.is_open:
@@ -326,72 +561,155 @@ class TemperatureMonitor:
             while self.serial_port.in_waiting:
                 self.serial_port.readline()
         
+        serial_failing = False  # Log a failure streak once, not on every retry
         while self.running:
             if self.serial_port and self.serial_port.is_open:
                 try:
-                    line = self.serial_port.readline().decode('utf-8').strip()
-                    print(f"Received data: {line}")
+                    # Block for the first byte, then drain everything already queued
+                    data = self.serial_port.read(1)
+                    if serial_failing:
+                        serial_failing = False
+                        print("Serial connection restored")
+                        self.write_log(f"{datetime.datetime.now()} - Serial connection restored\n")
+                    if not data:
+                        continue  # Timed out; re-check self.running
+                    if self.serial_port.in_waiting:
+                        data += self.serial_port.read(self.serial_port.in_waiting)
+                    buffer += data
                     
-                    if line:
-                        try:
-                            parts = line.split(':')
-                            if len(parts) == 2:
-                                temp_num = int(parts[0].split()[1])
-                                temp_value = float(parts[1].replace('C', '').strip())
-                                
-                                if 0 <= temp_num < numberOfThermistors:
-                                    temps[temp_num] = temp_value
-                                    
-                                    # Temperature warning checks
-                                    if temp_value >= 100:
-                                        self.shutdown_system()
-                                    elif temp_value >= 90:
-                                        self.speak_warning(
-                                            "GPU power connector temperature warning. Temperature above 90 degrees.",
-                                            'warning2'
-                                        )
-                                    elif temp_value >= 80:
-                                        self.speak_warning(
-                                            "Caution. GPU power connector temperature rising. Possible connector failure.",
-                                            'warning1'
-                                        )
-                                    
-                                    # Update temperature history
-                                    self.temp_history[temp_num].append(temp_value)
-                                    
-                                    # Only update time history once per complete cycle
-                                    if temp_num == numberOfThermistors - 1:  # Changed from 0 to last sensor
-                                        self.time_history.append(datetime.datetime.now())
-                                        self.readings_count += 1
-                                        print(f"Complete reading cycle {self.readings_count}")
-                                    
-                                    # Update icon with current max valid temperature
-                                    valid_temps = [t for t in temps if t > -999]
-                                    if valid_temps:  # Only update if we have valid temperatures
-                                        max_temp = max(valid_temps)
-                                        icon = self.create_temp_icon(max_temp)
-                                        self.tray_icon.icon = icon
-                                    
-                                    # Log temperatures
-                                    with open(self.log_file, "a", buffering=1) as log:
-                                        log.write(f"{datetime.datetime.now()} - Temp {temp_num}: {temp_value}C (Array: {temps})\n")
-                                        log.flush()
-                                else:
-                                    print(f"Invalid sensor number: {temp_num}")
-                                
-                        except ValueError as ve:
-                            print(f"Parse error: {str(ve)}")
-                            with open(self.log_file, "a", buffering=1) as log:
-                                log.write(f"{datetime.datetime.now()} - ERROR: Parse error: {str(ve)}\n")
-                                log.flush()
+                    # One clock reading is shared by every line in this batch
+                    now = time.time()
+                    
+                    # Process every complete line in the buffer
+                    while (newline := buffer.find(b'\n')) >= 0:
+                        line = bytes(buffer[:newline]).strip()
+                        del buffer[:newline + 1]
+                        if DEBUG_SERIAL:
+                            print(f"Received data: {line.decode('ascii', 'ignore')}")
+                        
+                        if line:
+                            self.process_line(line, now)
+                    
+                    # Settle the tray icon once for the whole batch
+                    self.update_tray_icon()
                             
                 except Exception as e:
-                    print(f"Serial read error: {str(e)}")
-                    with open(self.log_file, "a", buffering=1) as log:
-                        log.write(f"{datetime.datetime.now()} - ERROR: Serial error: {str(e)}\n")
-                        log.flush()
+                    if not serial_failing:
+                        serial_failing = True
+                        print(f"Serial read error: {str(e)}")
+                        self.write_log(f"{datetime.datetime.now()} - ERROR: Serial error: {str(e)}\n")
+                    if isinstance(e, serial.SerialException):
+                        # The port is gone (e.g. board unplugged); close it and reopen below
+                        try:
+                            self.serial_port.close()
+                        except Exception:
+                            pass
+                    time.sleep(SERIAL_TIMEOUT)  # Back off instead of spinning on a failing port
+            else:
+                time.sleep(SERIAL_TIMEOUT)  # No port to block on; avoid spinning
+                # Try to reopen a port that was closed after an error
+                if self.running and self.serial_port:
+                    try:
+                        self.serial_port.open()
+                        self.serial_port.reset_input_buffer()
+                        buffer.clear()  # Drop the partial line from before the failure
+                    except serial.SerialException:
+                        pass
+
+    def update_tray_icon(self):
+        """Queue a new tray icon when the max temperature shown needs to change"""
+        # Update icon with current max valid temperature; a batch in which no sensor
+        # changed its value cannot move the max, so stable readings skip this
+        # (unread sensors hold -999, so they never win the max)
+        if self.temps_changed and (max_temp := max(self.temps)) > -999:  # Only update if we have valid temperatures
+            self.icon_temp = int(max_temp)
+        self.temps_changed = False
+        
+        # Only touch the tray when the displayed value changes, at most once per interval;
+        # the PIL and tray work happens on the icon thread
+        now = time.monotonic()
+        if (self.icon_temp != self.last_icon_temp
+                and now - self.last_icon_update >= ICON_UPDATE_INTERVAL):
+            self.icon_queue.put(self.icon_temp)
+            self.last_icon_temp = self.icon_temp
+            self.last_icon_update = now
+
+    def watchdog_monitor(self):
+        """Warn once per outage when the sensor board stops sending valid readings"""
+        sensor_lost = False
+        while self.running:
+            # Sleeps until a reading arrives; a timeout is the fault condition
+            if self.data_event.wait(WATCHDOG_TIMEOUT):
+                self.data_event.clear()
+                if sensor_lost:
+                    sensor_lost = False
+                    print("Sensor data resumed")
+                    self.write_log(f"{datetime.datetime.now()} - Sensor data resumed\n")
+            elif not sensor_lost:
+                sensor_lost = True
+                print(f"WARNING: No sensor data for {WATCHDOG_TIMEOUT} seconds")
+                self.write_log(f"{datetime.datetime.now()} - ERROR: No sensor data for {WATCHDOG_TIMEOUT} seconds\n")
+                self.queue_speech("Warning. GPU temperature sensors are not responding.")
+
+    def parse_line(self, line):
+        """Parse a raw b'Temp N: VC' line into (sensor number, temperature), or None"""
+        match = TEMP_LINE_PATTERN.match(line)
+        if match is None:
+            return None
+        # int() and float() accept the matched bytes directly, no decode needed
+        return int(match[1]), float(match[2])
+
+    def process_line(self, line, now):
+        """Parse a single 'Temp N: VC' line and update warnings, history and log"""
+        temps = self.temps
+        reading = self.parse_line(line)
+        if reading is None:
+            if line.startswith(b'Temp'):  # Looks like a reading but is garbled
+                print(f"Parse error: {line.decode('ascii', 'replace')}")
+                self.write_log(f"{datetime.datetime.fromtimestamp(now)} - ERROR: Parse error: {line.decode('ascii', 'replace')}\n")
+            return
+        
+        temp_num, temp_value = reading
+        
+        if 0 <= temp_num < numberOfThermistors:
+            self.data_event.set()  # Feed the watchdog
+            if temps[temp_num] != temp_value:
+                self.temps_changed = True
+            temps[temp_num] = temp_value
+            
+            # Temperature warning checks: 0 = normal, 1/2 = warnings, 3 = shutdown
+            level = bisect.bisect_right(TEMP_THRESHOLDS, temp_value)
+            previous_level = self.temp_levels[temp_num]
+            self.temp_levels[temp_num] = level
+            if level == 3:
+                # Shut down once when a sensor crosses 100°C, not on every reading above it;
+                # if the shutdown failed, stay below level 3 so the next reading retries it
+                if previous_level < 3 and not self.shutdown_system():
+                    self.temp_levels[temp_num] = previous_level
+            elif level:
+                self.speak_warning(*TEMP_WARNINGS[level])
+            
+            # Collect the reading for the cycle in progress
+            self.cycle_temps[temp_num] = temp_value
+            
+            # Only update history once per complete cycle
+            if temp_num == numberOfThermistors - 1:  # Changed from 0 to last sensor
+                # One datetime per cycle serves both the history and the log record
+                cycle_time = datetime.datetime.fromtimestamp(now)
+                self.history.append((cycle_time, self.cycle_temps))
                 
-                time.sleep(0.01)
+                # Log one CSV row per completed cycle with only what arrived in it;
+                # sensors that did not report this cycle show as -999
+                row = ",".join("-999" if np.isnan(t) else f"{t:g}" for t in self.cycle_temps)
+                self.write_log(f"{cycle_time} - Temps: {row}\n")
+                
+                self.cycle_temps[:] = np.nan  # Start the next cycle empty
+                self.readings_count += 1
+                self.graph_dirty = True
+                if DEBUG_SERIAL:
+                    print(f"Complete reading cycle {self.readings_count}")
+        else:
+            print(f"Invalid sensor number: {temp_num}")
 
     def quit_app(self):
         """Clean up and exit"""
@@ -409,10 +727,9 @@ class TemperatureMonitor:
             print(f"Error closing serial port: {str(e)}")
         
         try:
-            # Log application shutdown
-            with open(self.log_file, "a", buffering=1) as log:
-                log.write(f"{datetime.datetime.now()} - Application shutdown\n")
-                log.flush()
+            # Log application shutdown and let the writer drain and close the log
+            self.write_log(f"{datetime.datetime.now()} - Application shutdown\n")
+            self.close_log()
         except Exception as e:
             print(f"Error writing to log file: {str(e)}")
         
@@ -441,11 +758,8 @@ class TemperatureMonitor:
         os._exit(0)
 
 if __name__ == "__main__":
-    # Check if running with admin privileges
-    try:
-        if not os.path.exists("C:\\Windows\\System32"):
-            raise PermissionError
-    except PermissionError:
+    # Check if running with admin privileges (needed for shutdown on Windows)
+    if os.name == 'nt' and not ctypes.windll.shell32.IsUserAnAdmin():
         print("Please run as administrator for shutdown functionality")
         sys.exit(1)
 